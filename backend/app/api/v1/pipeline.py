@@ -5,45 +5,62 @@ from __future__ import annotations
 import asyncio
 from typing import AsyncIterator
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel
 
 from ...schemas.pipeline import (
     PipelineRunRequest,
     PipelineRunStatusResponse,
     PipelineRunTriggerResponse,
 )
-from ...services.pipeline_runner import PipelineRunner
+from ...services.pipeline_runner import PipelineRunner, get_pipeline_runner
 from ...services.run_state import RunStateManager
 
 router = APIRouter()
 
+# Idle interval after which an SSE comment is sent so dead clients are noticed.
+SSE_KEEPALIVE_SECONDS = 15.0
+# After a frame arrives, how long to wait for others from the same burst to share its write.
+SSE_COALESCE_SECONDS = 0.005
 
-@router.post("/run", response_model=PipelineRunTriggerResponse)
+
+def _json_response(model: BaseModel, status_code: int = 200) -> Response:
+    """Serialize a response model in a single pydantic-core pass.
+
+    Returning a `Response` directly skips FastAPI's response_model round-trip
+    (re-validation, dict dump, then stdlib `json.dumps`); the decorators still
+    declare `response_model` so the OpenAPI schema is unchanged.
+    """
+
+    return Response(content=model.model_dump_json(), status_code=status_code, media_type="application/json")
+
+
+@router.post("/run", response_model=PipelineRunTriggerResponse, status_code=202)
 async def trigger_pipeline_run(
     payload: PipelineRunRequest,
     background_tasks: BackgroundTasks,
-) -> PipelineRunTriggerResponse:
+    runner: PipelineRunner = Depends(get_pipeline_runner),
+) -> Response:
     """Enqueue a pipeline run and return its identifier."""
 
     manager = RunStateManager.instance()
     state = await manager.create_run(payload.run_name, payload)
 
-    runner = PipelineRunner()
     background_tasks.add_task(runner.execute_with_tracking, state.run_id, payload)
 
-    return PipelineRunTriggerResponse(run_id=state.run_id)
+    return _json_response(PipelineRunTriggerResponse.model_construct(run_id=state.run_id), status_code=202)
 
 
 @router.get("/run/{run_id}", response_model=PipelineRunStatusResponse)
-async def get_pipeline_run_status(run_id: str) -> PipelineRunStatusResponse:
+async def get_pipeline_run_status(run_id: str) -> Response:
     """Fetch the latest known status for a pipeline run."""
 
     manager = RunStateManager.instance()
     status = await manager.get_status(run_id)
     if status is None:
         raise HTTPException(status_code=404, detail="Run not found")
-    return status
+    return _json_response(status)
 
 
 @router.get("/run/{run_id}/stream")
@@ -51,18 +68,56 @@ async def stream_pipeline_run(run_id: str) -> StreamingResponse:
     """Server-Sent Events stream emitting run lifecycle updates."""
 
     manager = RunStateManager.instance()
-    queue = manager.get_queue(run_id)
-    if queue is None:
+    state = manager.get_run(run_id)
+    if state is None:
         raise HTTPException(status_code=404, detail="Run not found")
-
-    async def event_generator() -> AsyncIterator[str]:
-        try:
-            while True:
-                message = await queue.get()
-                if message is None:
+    queue = state.queue
+    terminated = state.terminated
+
+    async def event_generator() -> AsyncIterator[bytes]:
+        while True:
+            batch = _drain_queue(queue)
+            if not batch:
+                # Anything published before termination has been drained above.
+                if terminated.is_set():
                     break
-                yield message
-        except asyncio.CancelledError:  # pragma: no cover - connection dropped
-            raise
+                message = await _next_message(queue, terminated)
+                if message is None:
+                    if not terminated.is_set():
+                        yield b": keepalive\n\n"
+                    continue
+                # Stage transitions arrive in bursts (running, then done); coalesce them into one write.
+                await asyncio.sleep(SSE_COALESCE_SECONDS)
+                batch = [message, *_drain_queue(queue)]
+            yield batch[0] if len(batch) == 1 else b"".join(batch)
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
+
+
+async def _next_message(queue: asyncio.Queue[bytes], terminated: asyncio.Event) -> bytes | None:
+    """Wait for the next message; None means the run terminated or the keepalive interval elapsed."""
+
+    get_task = asyncio.ensure_future(queue.get())
+    terminated_task = asyncio.ensure_future(terminated.wait())
+    try:
+        await asyncio.wait(
+            {get_task, terminated_task},
+            timeout=SSE_KEEPALIVE_SECONDS,
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+    finally:
+        terminated_task.cancel()
+        # A cancelled get never removes an item, so nothing is lost when it loses the race.
+        get_task.cancel()
+    if get_task.done() and not get_task.cancelled():
+        return get_task.result()
+    return None
+
+
+def _drain_queue(queue: asyncio.Queue[bytes]) -> list[bytes]:
+    drained: list[bytes] = []
+    while True:
+        try:
+            drained.append(queue.get_nowait())
+        except asyncio.QueueEmpty:
+            return drained
@@ -1,16 +1,17 @@
 """Application configuration management."""
 
-from functools import lru_cache
+import os
+from dataclasses import dataclass, field
 from pathlib import Path
 
-from pydantic import Field
-from pydantic_settings import BaseSettings
+from dotenv import dotenv_values
 
 
 BACKEND_ROOT = Path(__file__).resolve().parents[2]
 
 
-class Settings(BaseSettings):
+@dataclass(frozen=True, slots=True)
+class Settings:
     """Centralized application settings.
 
     Values are read from environment variables with sensible defaults so the demo
@@ -18,27 +19,71 @@ class Settings(BaseSettings):
     should be injected via a real `.env` file that mirrors `.env.example`.
     """
 
-    app_name: str = Field(default="Agent SM Backend")
-    backend_cors_origins: str = Field(default="http://localhost:5173")
+    app_name: str = "Agent SM Backend"
+    backend_cors_origins: str = "http://localhost:5173"
 
-    gemini_api_key: str | None = Field(default=None, env="GEMINI_API_KEY")
-    tts_api_key: str | None = Field(default=None, env="TTS_API_KEY")
-    tts_voice_id: str = Field(default="JBFqnCBsd6RMkjVDRZzb", env="TTS_VOICE_ID")
-    tts_model: str = Field(default="eleven_multilingual_v2", env="TTS_MODEL")
+    gemini_api_key: str | None = None
+    tts_api_key: str | None = None
+    tts_voice_id: str = "JBFqnCBsd6RMkjVDRZzb"
+    tts_model: str = "eleven_multilingual_v2"
 
-    assets_dir: str = Field(default=str(BACKEND_ROOT / "assets"))
-    outputs_dir: str = Field(default=str(BACKEND_ROOT / "outputs"))
+    assets_dir: str = str(BACKEND_ROOT / "assets")
+    outputs_dir: str = str(BACKEND_ROOT / "outputs")
+    # Internal nginx location mapped to outputs_dir; when set, file transfers are offloaded to nginx.
+    outputs_accel_redirect: str | None = None
+    # Re-read each rendered video after encoding and log its durations.
+    debug_validation: bool = False
 
-    primary_color: str = Field(default="#300A55")
-    secondary_color: str = Field(default="#EBEDFA")
+    # Draft-quality x264 by default; set the codec to "h264_nvenc" on hosts with an NVIDIA GPU.
+    video_encoder_codec: str = "libx264"
+    video_encoder_preset: str = "veryfast"
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    # Threads shared by all runs for blocking stage work (network calls, file I/O, render dispatch).
+    pipeline_workers: int = 4
+    # Buffered SSE frames per run; the oldest frame is dropped once a slow client falls this far behind.
+    sse_queue_max: int = 64
+
+    primary_color: str = "#300A55"
+    secondary_color: str = "#EBEDFA"
+
+    cors_origins: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        origins = tuple(origin.strip() for origin in self.backend_cors_origins.split(","))
+        object.__setattr__(self, "cors_origins", tuple(origin for origin in origins if origin))
+
+
+def _load_settings() -> Settings:
+    """Build settings from the process environment layered over `.env`."""
+
+    env = {key.upper(): value for key, value in dotenv_values(".env", encoding="utf-8").items() if value is not None}
+    env.update((key.upper(), value) for key, value in os.environ.items())
+    defaults = Settings()
+
+    return Settings(
+        app_name=env.get("APP_NAME", defaults.app_name),
+        backend_cors_origins=env.get("BACKEND_CORS_ORIGINS", defaults.backend_cors_origins),
+        gemini_api_key=env.get("GEMINI_API_KEY") or None,
+        tts_api_key=env.get("TTS_API_KEY") or None,
+        tts_voice_id=env.get("TTS_VOICE_ID", defaults.tts_voice_id),
+        tts_model=env.get("TTS_MODEL", defaults.tts_model),
+        assets_dir=env.get("ASSETS_DIR", defaults.assets_dir),
+        outputs_dir=env.get("OUTPUTS_DIR", defaults.outputs_dir),
+        outputs_accel_redirect=env.get("OUTPUTS_ACCEL_REDIRECT") or None,
+        debug_validation=env.get("DEBUG_VALIDATION", "").strip().lower() in {"1", "true", "yes", "on"},
+        video_encoder_codec=env.get("VIDEO_ENCODER_CODEC", defaults.video_encoder_codec),
+        video_encoder_preset=env.get("VIDEO_ENCODER_PRESET", defaults.video_encoder_preset),
+        pipeline_workers=int(env.get("PIPELINE_WORKERS", defaults.pipeline_workers)),
+        sse_queue_max=int(env.get("SSE_QUEUE_MAX", defaults.sse_queue_max)),
+        primary_color=env.get("PRIMARY_COLOR", defaults.primary_color),
+        secondary_color=env.get("SECONDARY_COLOR", defaults.secondary_color),
+    )
+
+
+_SETTINGS = _load_settings()
 
 
-@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Return a cached settings instance for app-wide reuse."""
+    """Return the settings instance resolved at import time."""
 
-    return Settings()  # type: ignore[call-arg]
+    return _SETTINGS
@@ -1,7 +1,48 @@
 """Logging configuration helpers."""
 
 import logging
+from contextvars import ContextVar
 from logging.config import dictConfig
+from typing import Any
+
+import orjson
+
+# Attributes every LogRecord carries; anything else on a record arrived via `extra=`.
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", logging.INFO, "", 0, "", None, None))) | {"message", "asctime"}
+
+# Id of the pipeline run the current task or worker thread is executing, if any.
+run_id_var: ContextVar[str | None] = ContextVar("run_id", default=None)
+
+
+class RunContextFilter(logging.Filter):
+    """Stamp records emitted while a run is executing with that run's id."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        run_id = run_id_var.get()
+        # A run id passed explicitly via `extra=` wins over the ambient one.
+        if run_id is not None and not hasattr(record, "run_id"):
+            record.run_id = run_id
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Render each record as one JSON line, including any `extra=` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: dict[str, Any] = {
+            "ts": record.created,
+            "lvl": record.levelname,
+            "name": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            payload["stack_info"] = self.formatStack(record.stack_info)
+        return orjson.dumps(payload, default=str).decode()
 
 
 def configure_logging() -> None:
@@ -9,16 +50,23 @@ def configure_logging() -> None:
 
     logging_config = {
         "version": 1,
+        # Module-level loggers are created on import, before this runs; keep them enabled.
         "disable_existing_loggers": False,
         "formatters": {
-            "standard": {
-                "format": "%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+            "json": {
+                "()": JsonFormatter,
+            }
+        },
+        "filters": {
+            "run_context": {
+                "()": RunContextFilter,
             }
         },
         "handlers": {
             "console": {
                 "class": "logging.StreamHandler",
-                "formatter": "standard",
+                "formatter": "json",
+                "filters": ["run_context"],
                 "level": "INFO",
             }
         },
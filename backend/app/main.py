@@ -1,10 +1,11 @@
 """FastAPI application entry point."""
 
 from pathlib import Path
+from urllib.parse import quote
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import FileResponse, Response
 
 from .api.router import api_router
 from .core.config import get_settings
@@ -17,18 +18,33 @@ app = FastAPI(title=settings.app_name)
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[origin.strip() for origin in settings.backend_cors_origins.split(",")],
+    allow_origins=list(settings.cors_origins),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-Path(settings.outputs_dir).mkdir(parents=True, exist_ok=True)
-app.mount("/api/outputs", StaticFiles(directory=settings.outputs_dir), name="outputs")
+outputs_root = Path(settings.outputs_dir).resolve()
+outputs_root.mkdir(parents=True, exist_ok=True)
 
 app.include_router(api_router, prefix="/api")
 
 
+@app.api_route("/api/outputs/{file_path:path}", methods=["GET", "HEAD"], include_in_schema=False)
+def serve_output(file_path: str) -> Response:
+    """Serve rendered deliverables, handing the transfer to nginx when configured."""
+
+    resolved = (outputs_root / file_path).resolve()
+    if not resolved.is_relative_to(outputs_root) or not resolved.is_file():
+        raise HTTPException(status_code=404, detail="Not Found")
+
+    if settings.outputs_accel_redirect:
+        relative = resolved.relative_to(outputs_root).as_posix()
+        location = f"{settings.outputs_accel_redirect.rstrip('/')}/{quote(relative)}"
+        return Response(headers={"X-Accel-Redirect": location})
+    return FileResponse(resolved)
+
+
 @app.get("/health", tags=["health"])
 def health_check() -> dict[str, str]:
     """Simple health check endpoint for uptime monitoring."""
@@ -1,19 +1,19 @@
 """Pydantic models describing pipeline requests and responses."""
 
-from enum import Enum
+from enum import StrEnum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class PipelinePlatform(str, Enum):
+class PipelinePlatform(StrEnum):
     """Supported social export targets."""
 
     instagram = "instagram"
     tiktok = "tiktok"
 
 
-class PipelineStage(str, Enum):
+class PipelineStage(StrEnum):
     """Agent stages surfaced to the frontend."""
 
     ingest = "ingest"
@@ -28,6 +28,9 @@ class PipelineStage(str, Enum):
 class PipelineStageSnapshot(BaseModel):
     """Status snapshot for a specific pipeline stage."""
 
+    # Immutable so identical snapshots can be shared between runs and events.
+    model_config = ConfigDict(frozen=True)
+
     stage: PipelineStage
     status: str = Field(description="Current status label (e.g., pending, running, done)")
     detail: str | None = Field(default=None, description="Human-friendly summary")
@@ -63,7 +66,7 @@ class PipelineRunTriggerResponse(BaseModel):
     run_id: str
 
 
-class PipelineRunStatus(str, Enum):
+class PipelineRunStatus(StrEnum):
     """Overall pipeline run lifecycle state."""
 
     queued = "queued"
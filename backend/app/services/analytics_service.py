@@ -5,11 +5,12 @@ from __future__ import annotations
 import logging
 import math
 from dataclasses import dataclass
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AnalyticsPayload:
     expected_ctr: float
     retention_score: float
@@ -23,19 +24,20 @@ class AnalyticsPayload:
         }
 
 
-class AnalyticsService:
-    """Computes proxy engagement metrics based on narrative properties."""
+@lru_cache(maxsize=256)
+def _evaluate_cached(script: str, caption: str) -> tuple[float, float, float]:
+    """Return rounded (ctr, retention, complexity) scores; reruns with the same copy hit the cache."""
 
-    def evaluate(self, script: str, caption: str) -> AnalyticsPayload:
-        script_words = len(script.split())
-        caption_words = len(caption.split())
-        total_words = script_words + caption_words
-        reading_time = total_words / 150 if total_words else 0.5
+    script_words = len(script.split()) if script else 0
+    caption_words = len(caption.split()) if caption else 0
+    total_words = script_words + caption_words
+    reading_time = total_words / 150 if total_words else 0.5
 
-        expected_ctr = min(0.25, 0.08 + 0.0005 * max(caption_words - 60, 0))
-        retention_score = max(0.6, min(0.95, 0.7 + 0.02 * math.log(max(script_words, 30), 10)))
-        narrative_complexity = min(1.0, (script_words / max(reading_time, 0.5)) / 250)
+    expected_ctr = min(0.25, 0.08 + 0.0005 * max(caption_words - 60, 0))
+    retention_score = max(0.6, min(0.95, 0.7 + 0.02 * math.log10(max(script_words, 30))))
+    narrative_complexity = min(1.0, (script_words / max(reading_time, 0.5)) / 250)
 
+    if logger.isEnabledFor(logging.DEBUG):
         logger.debug(
             "Analytics computed",
             extra={
@@ -45,8 +47,16 @@ class AnalyticsService:
             },
         )
 
+    return round(expected_ctr, 3), round(retention_score, 3), round(narrative_complexity, 3)
+
+
+class AnalyticsService:
+    """Computes proxy engagement metrics based on narrative properties."""
+
+    def evaluate(self, script: str, caption: str) -> AnalyticsPayload:
+        expected_ctr, retention_score, narrative_complexity = _evaluate_cached(script, caption)
         return AnalyticsPayload(
-            expected_ctr=round(expected_ctr, 3),
-            retention_score=round(retention_score, 3),
-            narrative_complexity=round(narrative_complexity, 3),
+            expected_ctr=expected_ctr,
+            retention_score=retention_score,
+            narrative_complexity=narrative_complexity,
         )
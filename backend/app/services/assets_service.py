@@ -2,21 +2,29 @@
 
 from __future__ import annotations
 
-import json
+import atexit
 import logging
-from dataclasses import dataclass
-from dataclasses import dataclass
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterable
 
 import httpx
+import orjson
 from moviepy import ColorClip
 import shutil
 
 from ..core.config import get_settings
+from ..utils.concurrency import in_current_context
 
 logger = logging.getLogger(__name__)
 
+# Stream downloads in 1 MiB chunks rather than httpx's small default.
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
 
 @dataclass(frozen=True)
 class AssetDescriptor:
@@ -28,14 +36,19 @@ class AssetDescriptor:
     keywords: list[str]
     license: str
     local_path: str | None
+    keywords_lower: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "keywords_lower", frozenset(keyword.lower() for keyword in self.keywords))
 
     @classmethod
     def from_dict(cls, payload: dict[str, object]) -> "AssetDescriptor":
+        keywords = [str(keyword) for keyword in payload.get("keywords", [])]
         return cls(
             asset_id=str(payload["id"]),
             filename=str(payload["filename"]),
             source_url=str(payload.get("source_url", "")),
-            keywords=[str(keyword) for keyword in payload.get("keywords", [])],
+            keywords=keywords,
             license=str(payload.get("license", "unknown")),
             local_path=str(payload.get("local_path")) if payload.get("local_path") else None,
         )
@@ -46,11 +59,18 @@ class AssetService:
 
     def __init__(self) -> None:
         self.settings = get_settings()
-        self.manifest_path = Path(self.settings.assets_dir) / "stock_manifest.json"
-        self.download_dir = Path(self.settings.assets_dir) / "downloads"
+        self.assets_dir = Path(self.settings.assets_dir)
+        self.manifest_path = self.assets_dir / "stock_manifest.json"
+        self.download_dir = self.assets_dir / "downloads"
         self.download_dir.mkdir(parents=True, exist_ok=True)
-        self.placeholder_dir = Path(self.settings.assets_dir) / "placeholders"
+        self.placeholder_dir = self.assets_dir / "placeholders"
         self.placeholder_dir.mkdir(parents=True, exist_ok=True)
+        self._manifest_cache: tuple[int, list[AssetDescriptor]] | None = None
+        # Built up front: assets are fetched from several threads, and a lazily created client
+        # would race. The runner (and so this service) lives for the whole process; release on exit.
+        self._http = httpx.Client(timeout=60, limits=httpx.Limits(max_keepalive_connections=8))
+        atexit.register(self.close)
+        self._placeholder_lock = threading.Lock()
 
     def prepare_assets(self, requested_keywords: Iterable[str]) -> dict[str, object]:
         """Select and download assets matching the supplied keywords."""
@@ -58,40 +78,10 @@ class AssetService:
         manifest = self._load_manifest()
         selected = self._select_assets(manifest, requested_keywords)
         downloaded_assets: list[dict[str, object]] = []
-
-        for asset in selected:
-            local_path = self.download_dir / asset.filename
-            placeholder_used = False
-            if not local_path.exists():
-                try:
-                    if asset.local_path:
-                        source_path = Path(self.settings.assets_dir) / asset.local_path
-                        if not source_path.exists():
-                            raise FileNotFoundError(f"Local asset not found at {source_path}")
-                        shutil.copy2(source_path, local_path)
-                        logger.info("Copied local asset", extra={"asset_id": asset.asset_id})
-                    elif asset.source_url:
-                        logger.info("Downloading asset", extra={"asset_id": asset.asset_id})
-                        self._download_asset(asset.source_url, local_path)
-                    else:
-                        raise RuntimeError("No source URL or local path available")
-                except Exception as exc:
-                    logger.warning("Asset unavailable; generating placeholder clip. Error: %s", exc)
-                    local_path = self._create_placeholder_clip(asset.asset_id)
-                    placeholder_used = True
-            else:
-                logger.debug("Asset cached", extra={"asset_id": asset.asset_id})
-
-            downloaded_assets.append(
-                {
-                    "id": asset.asset_id,
-                    "local_path": str(local_path),
-                    "keywords": asset.keywords,
-                    "license": asset.license,
-                    "source_url": asset.source_url,
-                    "placeholder": placeholder_used,
-                }
-            )
+        if selected:
+            # Downloads are network-bound; fetch them concurrently and keep manifest order.
+            with ThreadPoolExecutor(max_workers=len(selected), thread_name_prefix="asset-fetch") as pool:
+                downloaded_assets = list(pool.map(in_current_context(self._prepare_asset), selected))
 
         return {
             "assets": downloaded_assets,
@@ -99,14 +89,53 @@ class AssetService:
             "assets_dir": str(self.download_dir),
         }
 
+    def _prepare_asset(self, asset: AssetDescriptor) -> dict[str, object]:
+        local_path = self.download_dir / asset.filename
+        placeholder_used = False
+        if not local_path.exists():
+            try:
+                if asset.local_path:
+                    source_path = self.assets_dir / asset.local_path
+                    if not source_path.exists():
+                        raise FileNotFoundError(f"Local asset not found at {source_path}")
+                    shutil.copy2(source_path, local_path)
+                    logger.info("Copied local asset", extra={"asset_id": asset.asset_id})
+                elif asset.source_url:
+                    logger.info("Downloading asset", extra={"asset_id": asset.asset_id})
+                    self._download_asset(asset.source_url, local_path)
+                else:
+                    raise RuntimeError("No source URL or local path available")
+            except Exception as exc:
+                logger.warning("Asset unavailable; generating placeholder clip. Error: %s", exc)
+                local_path = self._create_placeholder_clip(asset.asset_id)
+                placeholder_used = True
+        else:
+            logger.debug("Asset cached", extra={"asset_id": asset.asset_id})
+
+        return {
+            "id": asset.asset_id,
+            "local_path": str(local_path),
+            "keywords": asset.keywords,
+            "license": asset.license,
+            "source_url": asset.source_url,
+            "placeholder": placeholder_used,
+        }
+
     def _load_manifest(self) -> list[AssetDescriptor]:
-        if not self.manifest_path.exists():
+        try:
+            mtime_ns = self.manifest_path.stat().st_mtime_ns
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Stock manifest not found at {self.manifest_path}. Please ensure assets are configured."
-            )
-        with self.manifest_path.open("r", encoding="utf-8") as file:
-            raw_manifest = json.load(file)
-        return [AssetDescriptor.from_dict(entry) for entry in raw_manifest]
+            ) from None
+        # Re-parse only when the manifest has been edited since the last load.
+        if self._manifest_cache is not None and self._manifest_cache[0] == mtime_ns:
+            return self._manifest_cache[1]
+        with self.manifest_path.open("rb") as file:
+            raw_manifest = orjson.loads(file.read())
+        manifest = [AssetDescriptor.from_dict(entry) for entry in raw_manifest]
+        self._manifest_cache = (mtime_ns, manifest)
+        return manifest
 
     def _select_assets(
         self, manifest: list[AssetDescriptor], requested_keywords: Iterable[str]
@@ -116,7 +145,7 @@ class AssetService:
             return manifest[:3]
         scored: list[tuple[int, AssetDescriptor]] = []
         for asset in manifest:
-            score = sum(1 for keyword in asset.keywords if keyword.lower() in keywords)
+            score = len(asset.keywords_lower & keywords)
             scored.append((score, asset))
         scored.sort(key=lambda item: item[0], reverse=True)
         top = [asset for score, asset in scored if score > 0]
@@ -124,12 +153,17 @@ class AssetService:
             top = [asset for _, asset in scored]
         return top[:3]
 
+    def close(self) -> None:
+        """Release pooled HTTP connections held for asset downloads."""
+
+        self._http.close()
+
     def _download_asset(self, url: str, destination: Path) -> None:
         try:
-            with httpx.stream("GET", url, timeout=60) as response:
+            with self._http.stream("GET", url) as response:
                 response.raise_for_status()
                 with destination.open("wb") as file_handle:
-                    for chunk in response.iter_bytes():
+                    for chunk in response.iter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE):
                         file_handle.write(chunk)
         except httpx.HTTPError as exc:
             raise RuntimeError(f"Failed to download asset from {url}: {exc}") from exc
@@ -139,15 +173,47 @@ class AssetService:
         if output_path.exists():
             return output_path
 
-        clip = ColorClip(size=(1080, 1920), color=(48, 10, 85), duration=6)
-        logger.info("Generating placeholder clip", extra={"asset_id": asset_id})
-        clip.write_videofile(
-            str(output_path),
-            codec="libx264",
-            audio=False,
-            fps=24,
-            preset="medium",
-            threads=2,
-        )
-        clip.close()
+        # Every placeholder is the same solid-colour clip, so encode it once and link it per asset.
+        canonical_path = self._canonical_placeholder_clip()
+        try:
+            os.link(canonical_path, output_path)
+        except FileExistsError:
+            pass
+        except OSError:
+            shutil.copyfile(canonical_path, output_path)
+            logger.info("Copied placeholder clip", extra={"asset_id": asset_id})
+            return output_path
+        logger.info("Linked placeholder clip", extra={"asset_id": asset_id})
         return output_path
+
+    def _canonical_placeholder_clip(self) -> Path:
+        canonical_path = self.placeholder_dir / "_canonical_placeholder.mp4"
+        if canonical_path.exists():
+            return canonical_path
+        # Assets are prepared concurrently; only one thread should run the encode.
+        with self._placeholder_lock:
+            if not canonical_path.exists():
+                self._render_canonical_placeholder(canonical_path)
+        return canonical_path
+
+    def _render_canonical_placeholder(self, canonical_path: Path) -> None:
+        # Encode to a scratch file first so an interrupted render is never reused; the name is unique
+        # because other worker processes may be rendering the same placeholder concurrently.
+        scratch_path = self.placeholder_dir / f"_canonical_placeholder.{uuid.uuid4().hex}.partial.mp4"
+        clip = ColorClip(size=(1080, 1920), color=(48, 10, 85), duration=6)
+        logger.info("Generating canonical placeholder clip", extra={"path": str(canonical_path)})
+        try:
+            clip.write_videofile(
+                str(scratch_path),
+                codec="libx264",
+                audio=False,
+                fps=24,
+                preset=self.settings.video_encoder_preset,
+                threads=2,
+            )
+            os.replace(scratch_path, canonical_path)
+        except BaseException:
+            scratch_path.unlink(missing_ok=True)
+            raise
+        finally:
+            clip.close()
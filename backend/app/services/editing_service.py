@@ -3,33 +3,58 @@
 from __future__ import annotations
 
 import logging
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import accumulate, cycle, islice
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Iterable
 
-from moviepy import AudioFileClip, ColorClip, VideoFileClip, concatenate_videoclips  # type: ignore[import-untyped]
-
-try:  # pragma: no cover - optional dependency path differences across MoviePy versions
-    from moviepy.audio.AudioClip import AudioArrayClip  # type: ignore[import-untyped]
-except ImportError:  # pragma: no cover
-    AudioArrayClip = None  # type: ignore[assignment]
-
-try:  # pragma: no cover
-    from moviepy.audio.compositing import CompositeAudioClip  # type: ignore[import-untyped]
-except ImportError:  # pragma: no cover
-    CompositeAudioClip = None  # type: ignore[assignment]
+from moviepy.config import FFMPEG_BINARY  # type: ignore[import-untyped]
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos  # type: ignore[import-untyped]
 
 from ..core.config import get_settings
+from ..utils.concurrency import in_current_context
+from ..utils.fs import ensure_dir
 
 logger = logging.getLogger(__name__)
 
+# Brand primary colour used for the generated sequence when no clip is usable.
+_PLACEHOLDER_COLOR = "0x300A55"
+_PLACEHOLDER_DURATION = 12.0
+# Variants encode side by side, so each ffmpeg process gets half the cores.
+_ENCODER_THREADS = max(1, (os.cpu_count() or 2) // 2)
+
+
+@dataclass(frozen=True)
+class MediaInfo:
+    """Container metadata read once from a source file."""
+
+    path: str | None
+    duration: float
+    width: int | None = None
+    height: int | None = None
+    fps: float | None = None
+
+
+@dataclass(frozen=True)
+class Segment:
+    """The leading `duration` seconds of a source placed on the output timeline."""
+
+    source: MediaInfo
+    duration: float
+
 
 class EditingService:
-    """Creates platform-specific cuts using MoviePy."""
+    """Creates platform-specific cuts with a single FFmpeg invocation per variant."""
 
     def __init__(self) -> None:
         self.settings = get_settings()
         self.outputs_dir = Path(self.settings.outputs_dir)
-        self.outputs_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(self.outputs_dir)
+        # Probed metadata keyed by path and validated against the file's (mtime_ns, size).
+        self._probe_cache: dict[str, tuple[tuple[int, int], MediaInfo]] = {}
 
     def produce_videos(
         self,
@@ -39,12 +64,11 @@ class EditingService:
     ) -> dict[str, str]:
         """Render Instagram and TikTok videos using provided assets."""
 
-        clips = self._load_clips(video_paths)
-        placeholder_clip: ColorClip | None = None
+        clips = self._probe_clips(video_paths)
         if not clips:
             logger.warning("No valid clips supplied; generating branded placeholder sequence")
-            placeholder_clip = ColorClip(size=(1080, 1920), color=(48, 10, 85), duration=12)
-            clips = [placeholder_clip]  # type: ignore[list-item]
+            # A source without a path renders as a solid brand-colour input.
+            clips = [MediaInfo(path=None, duration=_PLACEHOLDER_DURATION)]
 
         voiceover_file = Path(voiceover_path) if voiceover_path else None
         audio_path: Path | None = self._resolve_audio_path(voiceover_file)
@@ -55,125 +79,118 @@ class EditingService:
             str(audio_path) if audio_path else None,
             audio_path.is_file() if audio_path else False,
         )
+        audio: MediaInfo | None = None
+        if audio_path is not None:
+            try:
+                audio = self._probe(audio_path)
+                logger.info("Loaded voiceover track: path=%s duration=%s", str(audio_path), audio.duration)
+            except Exception as exc:
+                logger.warning("Unable to load voiceover track %s: %s", str(audio_path), exc)
+        else:
+            logger.info("Voiceover clip absent, proceeding silently: run=%s", run_name)
 
         instagram_path = self.outputs_dir / f"{run_name}_instagram.mp4"
         tiktok_path = self.outputs_dir / f"{run_name}_tiktok.mp4"
 
-        try:
-            self._render_variant(
-                clips,
-                audio_path,
-                instagram_path,
-                width=1080,
-                height=1920,
-                fps=24,
-                max_duration=45,
-            )
-            self._render_variant(
-                clips,
-                audio_path,
-                tiktok_path,
-                width=1080,
-                height=1920,
-                fps=30,
-                max_duration=35,
-            )
-        finally:
-            for clip in clips:
-                clip.close()
-            if placeholder_clip is not None:
-                placeholder_clip.close()
+        variants = (
+            (instagram_path, 24, 45),
+            (tiktok_path, 30, 35),
+        )
+        # Plans depend only on the clip list, audio length and duration cap, so
+        # variants sharing a cap share one plan.
+        plans: dict[int, list[Segment]] = {}
+        for _, _, max_duration in variants:
+            if max_duration not in plans:
+                plans[max_duration] = self._plan_segments(clips, audio, max_duration)
+
+        # Each render is an independent ffmpeg process; threads only wait on them.
+        render_variant = in_current_context(self._render_variant)
+        with ThreadPoolExecutor(max_workers=len(variants), thread_name_prefix="render") as pool:
+            futures = [
+                pool.submit(
+                    render_variant,
+                    plans[max_duration],
+                    audio,
+                    output_path,
+                    width=1080,
+                    height=1920,
+                    fps=fps,
+                    max_duration=max_duration,
+                )
+                for output_path, fps, max_duration in variants
+            ]
+            for future in futures:
+                future.result()
 
         return {
             "instagram_video": str(instagram_path),
             "tiktok_video": str(tiktok_path),
         }
 
-    def _load_clips(self, paths: Iterable[str]) -> list[VideoFileClip]:
-        loaded: list[VideoFileClip] = []
-        for path in paths:
-            clip: VideoFileClip | None = None
-            try:
-                try:
-                    clip = VideoFileClip(path, audio=False, load_images=True)
-                except TypeError:
-                    clip = VideoFileClip(path, audio=False)
-                # Force lazy readers to initialize so we can catch issues early.
-                _ = clip.duration
-                if getattr(clip, "reader", None) is None:
-                    raise RuntimeError("Clip reader failed to initialize")
-                loaded.append(clip)
-            except Exception as exc:
-                logger.warning("Unable to load clip %s: %s", path, exc)
-                if clip is not None:
-                    try:
-                        clip.close()
-                    except Exception:
-                        pass
-        return loaded
+    def _probe_clips(self, paths: Iterable[str]) -> list[MediaInfo]:
+        path_list = list(paths)
+        if not path_list:
+            return []
+        # Repeated paths are probed once and share the same MediaInfo in the returned order.
+        unique_paths = list(dict.fromkeys(path_list))
+        # Each probe is an ffmpeg subprocess, so threads overlap them without GIL contention.
+        with ThreadPoolExecutor(max_workers=min(8, len(unique_paths)), thread_name_prefix="probe") as pool:
+            probed = dict(zip(unique_paths, pool.map(in_current_context(self._probe_clip), unique_paths)))
+        return [info for info in (probed[path] for path in path_list) if info is not None]
+
+    def _probe_clip(self, path: str) -> MediaInfo | None:
+        try:
+            return self._probe(path, require_video=True)
+        except Exception as exc:
+            logger.warning("Unable to load clip %s: %s", path, exc)
+            return None
 
-    def _render_variant(
+    def _probe(self, path: str | Path, *, require_video: bool = False) -> MediaInfo:
+        """Read duration and geometry from the container header without decoding frames."""
+
+        key = str(path)
+        stat = Path(path).stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._probe_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        infos = ffmpeg_parse_infos(key)
+        if require_video and not infos.get("video_found"):
+            raise RuntimeError("No video stream found")
+        duration = infos.get("duration") or infos.get("video_duration")
+        if not duration or duration <= 0:
+            raise RuntimeError("Unable to determine media duration")
+        width, height = infos.get("video_size") or (None, None)
+        if abs(infos.get("video_rotation") or 0) % 180 == 90:
+            # FFmpeg autorotates on decode, so filters see the displayed geometry.
+            width, height = height, width
+        info = MediaInfo(
+            path=key,
+            duration=float(duration),
+            width=width,
+            height=height,
+            fps=infos.get("video_fps"),
+        )
+        self._probe_cache[key] = (signature, info)
+        return info
+
+    def _plan_segments(
         self,
-        clips: list[VideoFileClip],
-        audio_path: Path | None,
-        output_path: Path,
-        *,
-        width: int,
-        height: int,
-        fps: int,
+        clips: list[MediaInfo],
+        audio: MediaInfo | None,
         max_duration: int,
-    ) -> None:
-        audio_clip: AudioFileClip | None = None
-        working_audio_clip = None
-        materialized_audio_clip: Any = None
-        if audio_path is not None:
-            try:
-                audio_clip = AudioFileClip(str(audio_path))
-                logger.info(
-                    "Loaded voiceover clip: path=%s duration=%s",
-                    str(audio_path),
-                    getattr(audio_clip, "duration", None),
-                )
-                if AudioArrayClip is not None:
-                    try:
-                        fps_value = getattr(audio_clip, "fps", None) or 44100
-                        waveform = audio_clip.to_soundarray(fps=fps_value)
-                        if hasattr(waveform, "shape") and waveform.shape:
-                            sample_count = int(waveform.shape[0])
-                        else:
-                            sample_count = len(waveform)
-                        computed_duration = sample_count / float(fps_value)
-                        logger.info(
-                            "Materialized voiceover waveform: samples=%s fps=%s computed_duration=%s",
-                            sample_count,
-                            fps_value,
-                            computed_duration,
-                        )
-                        materialized_audio_clip = AudioArrayClip(waveform, fps=fps_value)
-                        if hasattr(materialized_audio_clip, "set_duration"):
-                            materialized_audio_clip = materialized_audio_clip.set_duration(audio_clip.duration)  # type: ignore[attr-defined]
-                        else:
-                            # Some MoviePy builds expose duration as attribute only.
-                            setattr(materialized_audio_clip, "duration", audio_clip.duration)
-                    except Exception as exc:
-                        logger.warning("Unable to materialize voiceover waveform: %s", exc)
-            except Exception as exc:
-                logger.warning("Unable to load voiceover track for %s: %s", output_path.name, exc)
-                audio_clip = None
-        else:
-            logger.info("Voiceover clip absent, proceeding silently: output=%s", str(output_path))
+    ) -> list[Segment]:
+        """Choose clip spans up to `max_duration` and fit them to the voiceover length."""
 
-        processed = []
+        processed: list[Segment] = []
         accumulated = 0.0
         for clip in clips:
             target_duration = min(clip.duration, 15)
             if target_duration < 5:
                 target_duration = clip.duration
-            segment = self._trim_clip(clip, target_duration)
-            segment = self._resize_clip(segment, width, height)
-            segment = self._crop_clip(segment, width, height)
-            processed.append(segment)
-            accumulated += segment.duration
+            processed.append(Segment(clip, target_duration))
+            accumulated += target_duration
             if accumulated >= max_duration:
                 break
 
@@ -181,144 +198,123 @@ class EditingService:
             raise RuntimeError("No processed clips available for export")
 
         target_duration = None
-        if audio_clip is not None:
-            target_duration = min(max_duration, audio_clip.duration)
+        if audio is not None:
+            target_duration = min(max_duration, audio.duration)
+
+        segments = self._fit_segments_to_duration(processed, target_duration)
+        if not segments:
+            raise RuntimeError("Unable to assemble segments for export")
+        return segments
 
-        segments_for_render = self._fit_segments_to_duration(processed, target_duration)
+    def _render_variant(
+        self,
+        segments_for_render: list[Segment],
+        audio: MediaInfo | None,
+        output_path: Path,
+        *,
+        width: int,
+        height: int,
+        fps: int,
+        max_duration: int,
+    ) -> None:
         assembled_duration = sum(segment.duration for segment in segments_for_render)
         logger.info(
-            "Prepared segments for render: output=%s segments=%s duration=%s target=%s",
+            "Prepared segments for render: output=%s segments=%s duration=%s",
             str(output_path),
             len(segments_for_render),
             assembled_duration,
-            target_duration,
         )
 
-        if not segments_for_render:
-            raise RuntimeError("Unable to assemble segments for export")
+        command = self._build_ffmpeg_command(
+            segments_for_render,
+            audio,
+            output_path,
+            width=width,
+            height=height,
+            fps=fps,
+            duration=min(assembled_duration, max_duration),
+        )
 
-        final_clip = concatenate_videoclips(segments_for_render, method="compose")
+        ensure_dir(output_path.parent)
+        logger.info("Rendering video", extra={"path": str(output_path)})
+        result = subprocess.run(command, capture_output=True, text=True)
+        if result.returncode != 0:
+            stderr_tail = result.stderr.strip()[-2000:]
+            raise RuntimeError(f"FFmpeg failed to render {output_path.name}: {stderr_tail}")
 
-        if audio_clip is not None:
-            try:
-                working_audio_clip = materialized_audio_clip or audio_clip
-                if (
-                    CompositeAudioClip is not None
-                    and working_audio_clip is not None
-                    and getattr(working_audio_clip, "is_audio_clip", False)
-                ):
-                    working_audio_clip = CompositeAudioClip([working_audio_clip])
-
-                if hasattr(final_clip, "set_audio"):
-                    final_clip = final_clip.set_audio(working_audio_clip)  # type: ignore[attr-defined]
-                elif hasattr(final_clip, "with_audio"):
-                    final_clip = final_clip.with_audio(working_audio_clip)  # type: ignore[attr-defined]
-                else:
-                    final_clip.audio = working_audio_clip  # type: ignore[attr-defined]
-                logger.info(
-                    "Attached original audio to final clip: output=%s audio_duration=%s video_duration=%s",
-                    str(output_path),
-                    getattr(working_audio_clip, "duration", None),
-                    getattr(final_clip, "duration", None),
-                )
-            except Exception as exc:
-                logger.warning("Failed to attach voiceover to %s: %s", output_path.name, exc)
-                working_audio_clip = None
+        if self.settings.debug_validation:
+            self._log_output_durations(output_path)
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        logger.info("Rendering video", extra={"path": str(output_path)})
+    def _log_output_durations(self, output_path: Path) -> None:
         try:
-            final_clip.write_videofile(
+            infos = ffmpeg_parse_infos(str(output_path))
+            logger.info(
+                "Validation playback durations: output=%s duration=%s video_duration=%s audio_found=%s",
                 str(output_path),
-                codec="libx264",
-                audio_codec="aac",
-                audio_bitrate="192k",
-                fps=fps,
-                preset="medium",
-                threads=2,
-                write_logfile=False,
+                infos.get("duration"),
+                infos.get("video_duration"),
+                infos.get("audio_found"),
             )
-        finally:
-            final_clip.close()
-            self._close_clips(segments_for_render, processed)
-            if (
-                working_audio_clip is not None
-                and working_audio_clip is not audio_clip
-                and working_audio_clip is not materialized_audio_clip
-            ):
-                try:
-                    working_audio_clip.close()
-                except Exception:
-                    pass
-            if materialized_audio_clip is not None:
-                try:
-                    materialized_audio_clip.close()
-                except Exception:
-                    pass
-            if audio_clip is not None:
-                try:
-                    audio_clip.close()
-                except Exception:
-                    pass
-            validation_clip: VideoFileClip | None = None
-            try:
-                validation_clip = VideoFileClip(str(output_path))
-                audio_duration = None
-                if getattr(validation_clip, "audio", None) is not None:
-                    audio_duration = getattr(validation_clip.audio, "duration", None)
-                logger.info(
-                    "Validation playback durations: output=%s video_duration=%s audio_duration=%s",
-                    str(output_path),
-                    getattr(validation_clip, "duration", None),
-                    audio_duration,
-                )
-            except Exception as exc:
-                logger.warning("Unable to validate rendered output %s: %s", str(output_path), exc)
-            finally:
-                if validation_clip is not None:
-                    try:
-                        validation_clip.close()
-                    except Exception:
-                        pass
-
-    def _trim_clip(self, clip: VideoFileClip, duration: float) -> VideoFileClip:
-        if duration >= clip.duration:
-            return clip
-        if hasattr(clip, "subclip"):
-            return clip.subclip(0, duration)  # type: ignore[attr-defined]
-        if hasattr(clip, "time_slice"):
-            return clip.time_slice(0, duration)  # type: ignore[attr-defined]
-        if hasattr(clip, "with_duration"):
-            return clip.with_duration(duration)  # type: ignore[attr-defined]
-        return clip
-
-    def _resize_clip(self, clip: VideoFileClip, width: int, height: int) -> VideoFileClip:
-        if not hasattr(clip, "resize") or not getattr(clip, "w", None) or not getattr(clip, "h", None):
-            return clip
-
-        target_ratio = width / height
-        clip_ratio = clip.w / clip.h
-
-        if clip_ratio < target_ratio:
-            return clip.resize(width=width)  # type: ignore[attr-defined]
-        return clip.resize(height=height)  # type: ignore[attr-defined]
-
-    def _crop_clip(self, clip: VideoFileClip, width: int, height: int) -> VideoFileClip:
-        if not hasattr(clip, "crop") or not getattr(clip, "w", None) or not getattr(clip, "h", None):
-            return clip
-
-        crop_width = min(width, clip.w)
-        crop_height = min(height, clip.h)
-
-        if crop_width == clip.w and crop_height == clip.h:
-            return clip
-
-        return clip.crop(
-            width=crop_width,
-            height=crop_height,
-            x_center=clip.w / 2,
-            y_center=clip.h / 2,
-        )  # type: ignore[attr-defined]
+        except Exception as exc:
+            logger.warning("Unable to validate rendered output %s: %s", str(output_path), exc)
+
+    def _build_ffmpeg_command(
+        self,
+        segments: list[Segment],
+        audio: MediaInfo | None,
+        output_path: Path,
+        *,
+        width: int,
+        height: int,
+        fps: int,
+        duration: float,
+    ) -> list[str]:
+        """Trim, cover-scale, centre-crop, concatenate and mux in one FFmpeg pass.
+
+        Each segment is its own input limited with `-t`, so FFmpeg only demuxes the
+        span it needs; frames stay in YUV inside the filtergraph from decode to encode.
+        """
+
+        command = [FFMPEG_BINARY, "-hide_banner", "-loglevel", "error", "-y"]
+        filters: list[str] = []
+        for index, segment in enumerate(segments):
+            source = segment.source
+            if source.path is None:
+                command += [
+                    "-f",
+                    "lavfi",
+                    "-t",
+                    f"{segment.duration:.3f}",
+                    "-i",
+                    f"color=c={_PLACEHOLDER_COLOR}:s={width}x{height}:r={fps}",
+                ]
+            else:
+                command += ["-t", f"{segment.duration:.3f}", "-i", source.path]
+            # Resample first so frames dropped from high-rate sources are never scaled.
+            chain = f"[{index}:v]fps={fps},"
+            # Generated colour inputs and clips already at the target size need no scale/crop.
+            if source.path is not None and (source.width, source.height) != (width, height):
+                chain += f"scale=w={width}:h={height}:force_original_aspect_ratio=increase,crop={width}:{height},"
+            filters.append(f"{chain}setsar=1,format=yuv420p[v{index}]")
+        labels = "".join(f"[v{index}]" for index in range(len(segments)))
+        filters.append(f"{labels}concat=n={len(segments)}:v=1:a=0[v]")
+
+        if audio is not None:
+            command += ["-i", str(audio.path)]
+        command += ["-filter_complex", ";".join(filters), "-map", "[v]"]
+        if audio is not None:
+            command += ["-map", f"{len(segments)}:a:0?", "-c:a", "aac", "-b:a", "192k"]
+        command += [
+            *self._video_encoder_args(),
+            "-threads",
+            str(_ENCODER_THREADS),
+            "-t",
+            f"{duration:.3f}",
+            "-movflags",
+            "+faststart",
+            str(output_path),
+        ]
+        return command
 
     def _resolve_audio_path(self, voiceover_file: Path | None) -> Path | None:
         if voiceover_file is None:
@@ -342,7 +338,14 @@ class EditingService:
         logger.warning("Voiceover file missing; proceeding without audio", extra={"voiceover_path": str(voiceover_file)})
         return None
 
-    def _fit_segments_to_duration(self, segments: list[VideoFileClip], target_duration: float | None) -> list[VideoFileClip]:
+    def _video_encoder_args(self) -> list[str]:
+        codec = self.settings.video_encoder_codec
+        if codec.endswith("_nvenc"):
+            # NVENC has its own preset scale; p5 is its balanced quality/speed point.
+            return ["-c:v", codec, "-rc", "vbr", "-cq", "23", "-preset", "p5"]
+        return ["-c:v", codec, "-preset", self.settings.video_encoder_preset, "-crf", "23"]
+
+    def _fit_segments_to_duration(self, segments: list[Segment], target_duration: float | None) -> list[Segment]:
         """Scale or loop prepared segments so the timeline matches target duration."""
         if target_duration is None or not segments:
             return segments
@@ -355,53 +358,38 @@ class EditingService:
 
         if total_duration > target_duration + tolerance:
             scale = target_duration / total_duration if total_duration else 1.0
-            adjusted: list[VideoFileClip] = []
-            accumulated = 0.0
-            remaining_segments = len(segments)
-            for index, segment in enumerate(segments):
-                remaining_segments = len(segments) - index
-                remaining_time = max(target_duration - accumulated, 0.0)
-                if remaining_time <= tolerance:
-                    break
-
-                desired = segment.duration * scale
-                # Ensure final segment absorbs any rounding difference.
-                if remaining_segments == 1:
-                    desired = remaining_time
-                desired = max(min(desired, remaining_time), 0.0)
-
+            # Cut points are the scaled prefix sums; the final segment absorbs any rounding difference.
+            ends = [min(end, target_duration) for end in accumulate(segment.duration * scale for segment in segments)]
+            ends[-1] = target_duration
+            adjusted: list[Segment] = []
+            start = 0.0
+            for segment, end in zip(segments, ends):
+                desired = end - start
+                start = end
                 if desired <= tolerance:
                     continue
-
                 if desired >= segment.duration - tolerance:
                     adjusted.append(segment)
-                    accumulated += segment.duration
                 else:
-                    trimmed = self._extract_segment(segment, desired)
-                    adjusted.append(trimmed)
-                    accumulated += min(desired, trimmed.duration)
-
+                    adjusted.append(Segment(segment.source, desired))
             return adjusted
 
         adjusted = []
         accumulated = 0.0
-        index = 0
         max_iterations = max(len(segments) * 10, 10)
-        while accumulated < target_duration - tolerance and index < max_iterations:
-            segment_index = index % len(segments)
-            segment = segments[segment_index]
-            remaining = target_duration - accumulated
-            duration = min(segment.duration, remaining)
-            if duration <= tolerance:
+        looped = list(islice(cycle(segments), max_iterations))
+        for segment, end in zip(looped, accumulate(segment.duration for segment in looped)):
+            if end >= target_duration - tolerance:
+                remaining = target_duration - accumulated
+                if remaining > tolerance:
+                    if remaining >= segment.duration - tolerance:
+                        adjusted.append(segment)
+                    else:
+                        adjusted.append(Segment(segment.source, remaining))
+                    accumulated = target_duration
                 break
-
-            if index < len(segments) and duration >= segment.duration - tolerance:
-                adjusted.append(segment)
-            else:
-                adjusted.append(self._extract_segment(segment, duration))
-
-            accumulated += duration
-            index += 1
+            adjusted.append(segment)
+            accumulated = end
 
         if accumulated < target_duration - tolerance:
             logger.warning(
@@ -410,82 +398,3 @@ class EditingService:
             )
 
         return adjusted if adjusted else segments
-
-    def _prepare_audio_clip(self, audio_clip: AudioFileClip, target_duration: float) -> AudioFileClip:
-        tolerance = 1e-3
-        if audio_clip.duration <= target_duration + tolerance and audio_clip.duration >= target_duration - tolerance:
-            return audio_clip
-
-        logger.info(
-            "Voiceover and video durations differ",
-            extra={"audio_duration": audio_clip.duration, "video_duration": target_duration},
-        )
-        return audio_clip
-
-    def _close_clips(self, *clip_lists: Iterable[VideoFileClip]) -> None:
-        seen: set[int] = set()
-        for clip_list in clip_lists:
-            for clip in clip_list:
-                if clip is None:
-                    continue
-                key = id(clip)
-                if key in seen:
-                    continue
-                seen.add(key)
-                try:
-                    clip.close()
-                except Exception:
-                    pass
-
-    def _extract_segment(self, clip: VideoFileClip, duration: float) -> VideoFileClip:
-        tolerance = 1e-3
-        if duration >= clip.duration - tolerance:
-            return clip
-
-        if hasattr(clip, "subclip"):
-            try:
-                return clip.subclip(0, duration)  # type: ignore[attr-defined]
-            except Exception:
-                pass
-
-        if hasattr(clip, "time_slice"):
-            try:
-                return clip.time_slice(0, duration)  # type: ignore[attr-defined]
-            except Exception:
-                pass
-
-        if hasattr(clip, "with_duration"):
-            try:
-                return clip.with_duration(duration)  # type: ignore[attr-defined]
-            except Exception:
-                pass
-
-        if hasattr(clip, "set_duration"):
-            try:
-                return clip.set_duration(duration)  # type: ignore[attr-defined]
-            except Exception:
-                pass
-
-        logger.warning("Clip provider lacks trimming primitives; using original duration", extra={"requested": duration, "actual": clip.duration})
-        return clip
-
-    def _extract_audio_segment(self, clip: AudioFileClip, duration: float) -> AudioFileClip:
-        tolerance = 1e-3
-        if duration >= getattr(clip, "duration", 0.0) - tolerance:
-            return clip
-
-        for attr in ("subclip", "time_slice", "with_duration", "set_duration"):
-            if hasattr(clip, attr):
-                handler = getattr(clip, attr)
-                try:
-                    if attr in {"with_duration", "set_duration"}:
-                        return handler(duration)  # type: ignore[misc]
-                    return handler(0, duration)  # type: ignore[misc]
-                except Exception:
-                    continue
-
-        logger.warning(
-            "Audio provider lacks trimming primitives; using original duration",
-            extra={"requested": duration, "actual": getattr(clip, "duration", None)},
-        )
-        return clip
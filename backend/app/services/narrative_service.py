@@ -2,20 +2,57 @@
 
 from __future__ import annotations
 
-import json
+import hashlib
 import logging
-from dataclasses import dataclass
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from string import Template
 from typing import Any
 
+import orjson
+
 try:  # pragma: no cover - optional dependency
     from google import genai
 except ImportError:  # pragma: no cover - handled via fallback path
     genai = None  # type: ignore[assignment]
 
 from ..core.config import get_settings
+from ..utils.fs import ensure_dir
 
 logger = logging.getLogger(__name__)
 
+# Leading/trailing Markdown code fences Gemini sometimes wraps around its JSON.
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$")
+
+# Leading indentation is part of the prompt text sent to Gemini.
+_PROMPT_TEMPLATE = Template(
+    """
+        You are the creative director for Masterminds Academy (),
+        a luxury, neuroscience-led educational institution for high-net-worth families in the UAE and US.
+
+        Generate a JSON object with the following keys:
+        - script: 90-120 word master narration in British English, majestic yet warm.
+        - instagram_caption: 3-4 sentence caption tailored to organic + lead generation.
+        - instagram_hashtags: Array of 6-8 concise hashtags targeting luxury education parents.
+        - tiktok_caption: 120 character hook-driven caption with a soft luxury appeal.
+        - tiktok_hashtags: Array of 5-6 emotionally resonant hashtags suited to TikTok trends.
+        - cta: A clear, aspirational call-to-action inviting a private tour or consultation.
+
+        Guardrails:
+        - Maintain authentic human tone, referencing neuroscience-backed learning and bespoke programs.
+        - Weave in UAE/US context subtly.
+        - Avoid clichés, emojis, and salesy language.
+        - Do not include quotation marks unless necessary for quoting.
+
+        Run Name: $run_name
+        Desired Platforms: $platform_str
+        Inspiration Keywords: $keyword_str
+
+        Return only valid JSON with string keys matching the schema above.
+        """
+)
+
 
 @dataclass
 class NarrativePayload:
@@ -51,10 +88,18 @@ class NarrativeService:
             except Exception as exc:  # pragma: no cover
                 logger.warning("Gemini configuration failed: %s", exc)
                 self.client = None
+        # Gemini responses persisted per input tuple; fallback copy is cheap and never cached.
+        self.cache_dir = Path(self.settings.outputs_dir) / ".narrative_cache"
 
     def generate(self, run_name: str, keywords: list[str], platform_targets: list[str]) -> NarrativePayload:
         """Return narrative artefacts tailored to both IG and TikTok."""
 
+        cache_path = self._cache_path(run_name, keywords, platform_targets)
+        cached = self._load_cached(cache_path)
+        if cached is not None:
+            logger.info("Using cached narrative", extra={"run": run_name})
+            return cached
+
         prompt = self._build_prompt(run_name, keywords, platform_targets)
         if self.client is not None:
             try:
@@ -64,6 +109,7 @@ class NarrativeService:
                     contents=prompt,
                 )
                 content = self._parse_response(response)
+                self._store_cached(cache_path, content)
                 return content
             except Exception as exc:  # pragma: no cover - fall back on handcrafted copy
                 logger.warning("Gemini narrative generation failed, using fallback. Error: %s", exc)
@@ -71,45 +117,39 @@ class NarrativeService:
         logger.info("Falling back to deterministic narrative generation", extra={"run": run_name})
         return self._fallback_narrative(keywords)
 
+    def _cache_path(self, run_name: str, keywords: list[str], platforms: list[str]) -> Path:
+        key_source = orjson.dumps([run_name, sorted(keywords), sorted(platforms)])
+        return self.cache_dir / f"{hashlib.sha1(key_source).hexdigest()}.json"
+
+    def _load_cached(self, cache_path: Path) -> NarrativePayload | None:
+        try:
+            return NarrativePayload(**orjson.loads(cache_path.read_bytes()))
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            logger.warning("Ignoring unreadable narrative cache entry %s: %s", str(cache_path), exc)
+            return None
+
+    def _store_cached(self, cache_path: Path, payload: NarrativePayload) -> None:
+        try:
+            ensure_dir(cache_path.parent)
+            cache_path.write_bytes(orjson.dumps(asdict(payload)))
+        except OSError as exc:
+            logger.warning("Unable to persist narrative cache entry %s: %s", str(cache_path), exc)
+
     def _build_prompt(self, run_name: str, keywords: list[str], platforms: list[str]) -> str:
         keyword_str = ", ".join(keywords) if keywords else "luxury education, neuroscience, bespoke parenting"
         platform_str = ", ".join(platforms) if platforms else "instagram, tiktok"
-        return f"""
-        You are the creative director for Masterminds Academy (),
-        a luxury, neuroscience-led educational institution for high-net-worth families in the UAE and US.
-
-        Generate a JSON object with the following keys:
-        - script: 90-120 word master narration in British English, majestic yet warm.
-        - instagram_caption: 3-4 sentence caption tailored to organic + lead generation.
-        - instagram_hashtags: Array of 6-8 concise hashtags targeting luxury education parents.
-        - tiktok_caption: 120 character hook-driven caption with a soft luxury appeal.
-        - tiktok_hashtags: Array of 5-6 emotionally resonant hashtags suited to TikTok trends.
-        - cta: A clear, aspirational call-to-action inviting a private tour or consultation.
-
-        Guardrails:
-        - Maintain authentic human tone, referencing neuroscience-backed learning and bespoke programs.
-        - Weave in UAE/US context subtly.
-        - Avoid clichés, emojis, and salesy language.
-        - Do not include quotation marks unless necessary for quoting.
-
-        Run Name: {run_name}
-        Desired Platforms: {platform_str}
-        Inspiration Keywords: {keyword_str}
-
-        Return only valid JSON with string keys matching the schema above.
-        """
+        return _PROMPT_TEMPLATE.substitute(run_name=run_name, platform_str=platform_str, keyword_str=keyword_str)
 
     def _parse_response(self, response: Any) -> NarrativePayload:
         data: dict[str, Any]
-        if hasattr(response, "text") and response.text:
-            text_payload = response.text
+        text_payload = getattr(response, "text", None)
+        if not text_payload:
+            raise RuntimeError("Gemini response contained no text")
         try:
-            text_payload = text_payload.strip("```json").strip("```").strip()
-            data = json.loads(text_payload)
-        except json.JSONDecodeError as exc:
-            logger.warning("Unable to parse Gemini response, raw text returned. Error: %s", exc)
-            raise RuntimeError("Gemini response was not valid JSON") from exc
-        except json.JSONDecodeError as exc:
+            data = orjson.loads(_FENCE_RE.sub("", text_payload))
+        except orjson.JSONDecodeError as exc:
             logger.warning("Unable to parse Gemini response, raw text returned. Error: %s", exc)
             raise RuntimeError("Gemini response was not valid JSON") from exc
 
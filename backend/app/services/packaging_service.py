@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import os
+import uuid
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from ..core.config import get_settings
+from ..utils.fs import ensure_dir
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +22,7 @@ class PackagingService:
     def __init__(self) -> None:
         self.settings = get_settings()
         self.outputs_dir = Path(self.settings.outputs_dir)
-        self.outputs_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(self.outputs_dir)
 
     def package(
         self,
@@ -27,8 +31,7 @@ class PackagingService:
         assets: dict[str, Any],
         video_paths: dict[str, str],
     ) -> dict[str, Any]:
-        bundle_dir = self.outputs_dir / run_name
-        bundle_dir.mkdir(parents=True, exist_ok=True)
+        bundle_dir = ensure_dir(self.outputs_dir / run_name)
         metadata_path = bundle_dir / "metadata.json"
 
         payload = {
@@ -37,8 +40,17 @@ class PackagingService:
             "assets": assets,
             "videos": video_paths,
         }
-        with metadata_path.open("w", encoding="utf-8") as file:
-            json.dump(payload, file, indent=2)
+        # Readers polling the bundle must never see a half-written file, so swap it in atomically.
+        temp_path = bundle_dir / f".metadata.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(temp_path, "wb") as handle:
+                handle.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(temp_path, metadata_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
 
         logger.info("Packaged outputs", extra={"metadata": str(metadata_path)})
         return {"metadata_path": str(metadata_path), "bundle_dir": str(bundle_dir)}
@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 import asyncio
-import datetime as dt
 import logging
+import os
+import time
 from pathlib import Path
 from dataclasses import asdict, is_dataclass
+from functools import lru_cache
 from typing import Any, Callable
 
 from ..core.config import get_settings
+from ..core.logging_config import run_id_var
+from ..utils.concurrency import run_blocking
 from ..schemas.pipeline import (
     PipelineRunRequest,
     PipelineRunResponse,
@@ -22,16 +26,33 @@ from .editing_service import EditingService
 from .narrative_service import NarrativePayload, NarrativeService
 from .packaging_service import PackagingService
 from .voiceover_service import VoiceoverService
-from .run_state import RunStateManager
+from .run_state import PIPELINE_STAGE_INDEX, PIPELINE_STAGE_ORDER, RunStateManager
 
 logger = logging.getLogger(__name__)
 
+# Exact leaf types copied into stage payloads unchanged; checked by type before any isinstance.
+_PASSTHROUGH_TYPES = frozenset({int, float, bool})
+
+
+@lru_cache(maxsize=1)
+def get_pipeline_runner() -> PipelineRunner:
+    """Return the process-wide runner; its services hold no per-run state and are built once."""
+
+    return PipelineRunner()
+
 
 class PipelineRunner:
-    """Coordinates the sequential stages for the demo pipeline."""
+    """Coordinates the stages of the demo pipeline.
+
+    Ingest has no dependency on narrative or voiceover, so it runs alongside
+    them; editing joins both branches and everything after it is sequential.
+    """
 
     def __init__(self) -> None:
         self.settings = get_settings()
+        self.outputs_dir = Path(self.settings.outputs_dir)
+        # Service outputs are built as `outputs_dir / ...`, so a string prefix test matches relative_to().
+        self._outputs_prefix = os.path.join(str(self.outputs_dir), "")
         self.assets_service = AssetService()
         self.narrative_service = NarrativeService()
         self.voiceover_service = VoiceoverService()
@@ -44,43 +65,63 @@ class PipelineRunner:
         return await self._execute(request)
 
     async def execute_with_tracking(self, run_id: str, request: PipelineRunRequest) -> None:
+        # Stage tasks and pool workers inherit this, so every log line from the run carries its id.
+        token = run_id_var.set(run_id)
         try:
-            await self.state_manager.mark_run_started(run_id)
+            self.state_manager.mark_run_started(run_id)
             response = await self._execute(request, run_id=run_id)
             await self.state_manager.mark_run_completed(run_id, response)
         except Exception as exc:  # pragma: no cover - runtime failure path
-            logger.exception("Pipeline run failed", extra={"run_id": run_id})
-            await self.state_manager.mark_run_failed(run_id, str(exc))
+            logger.exception("Pipeline run failed")
+            self.state_manager.mark_run_failed(run_id, str(exc))
+        finally:
+            # Release any open event streams even if the task was cancelled mid-run.
+            self.state_manager.close_run(run_id)
+            run_id_var.reset(token)
 
     async def _execute(self, request: PipelineRunRequest, run_id: str | None = None) -> PipelineRunResponse:
-        logger.info("Starting pipeline run", extra={"run_name": request.run_name, "run_id": run_id})
-        snapshots: list[PipelineStageSnapshot] = []
+        logger.info("Starting pipeline run", extra={"run_name": request.run_name})
+        # One slot per stage in pipeline order, so concurrent branches can finish in any order.
+        snapshots: list[PipelineStageSnapshot | None] = [None] * len(PIPELINE_STAGE_ORDER)
 
-        assets_payload = await self._run_stage(
-            stage=PipelineStage.ingest,
-            snapshots=snapshots,
-            executor=lambda: self.assets_service.prepare_assets(request.stock_keywords),
-            detail_builder=lambda payload: self._format_ingest_detail(payload),
-            run_id=run_id,
-        )
-
-        narrative_payload: NarrativePayload = await self._run_stage(
-            stage=PipelineStage.narrative,
-            snapshots=snapshots,
-            executor=lambda: self.narrative_service.generate(
-                request.run_name, request.stock_keywords, [platform.value for platform in request.platforms]
-            ),
-            detail_builder=lambda payload: "Generated master script and dual-platform captions.",
-            run_id=run_id,
-        )
+        async def narrate_and_voice() -> tuple[NarrativePayload, dict[str, Any]]:
+            narrative: NarrativePayload = await self._run_stage(
+                stage=PipelineStage.narrative,
+                snapshots=snapshots,
+                executor=lambda: self.narrative_service.generate(
+                    request.run_name, request.stock_keywords, [platform.value for platform in request.platforms]
+                ),
+                detail_builder=lambda payload: "Generated master script and dual-platform captions.",
+                run_id=run_id,
+            )
+            voiceover = await self._run_stage(
+                stage=PipelineStage.voiceover,
+                snapshots=snapshots,
+                executor=lambda: self.voiceover_service.synthesize(narrative.master_script, request.run_name),
+                detail_builder=lambda payload: f"Voiceover status: {payload.get('status', 'unknown')}.",
+                run_id=run_id,
+            )
+            return narrative, voiceover
 
-        voiceover_payload = await self._run_stage(
-            stage=PipelineStage.voiceover,
-            snapshots=snapshots,
-            executor=lambda: self.voiceover_service.synthesize(narrative_payload.master_script, request.run_name),
-            detail_builder=lambda payload: f"Voiceover status: {payload.get('status', 'unknown')}.",
-            run_id=run_id,
+        ingest_task = asyncio.create_task(
+            self._run_stage(
+                stage=PipelineStage.ingest,
+                snapshots=snapshots,
+                executor=lambda: self.assets_service.prepare_assets(request.stock_keywords),
+                detail_builder=lambda payload: self._format_ingest_detail(payload),
+                run_id=run_id,
+            )
         )
+        voice_task = asyncio.create_task(narrate_and_voice())
+        try:
+            assets_payload, (narrative_payload, voiceover_payload) = await asyncio.gather(ingest_task, voice_task)
+        except BaseException:
+            # gather leaves the surviving branch running; stop it so a failed run starts no further
+            # stages, and wait for it to record its cancelled stage before propagating.
+            ingest_task.cancel()
+            voice_task.cancel()
+            await asyncio.gather(ingest_task, voice_task, return_exceptions=True)
+            raise
 
         video_payload = await self._run_stage(
             stage=PipelineStage.editing,
@@ -121,12 +162,12 @@ class PipelineRunner:
         completion_snapshot = PipelineStageSnapshot(
             stage=PipelineStage.completed,
             status="done",
-            detail=f"Run finished at {dt.datetime.utcnow().isoformat()}Z",
+            detail=f"Run finished at {time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())}",
             payload=None,
         )
-        snapshots.append(completion_snapshot)
+        snapshots[PIPELINE_STAGE_INDEX[PipelineStage.completed]] = completion_snapshot
         if run_id:
-            await self.state_manager.update_stage(run_id, PipelineStage.completed, "done", completion_snapshot.detail, None)
+            self.state_manager.publish_snapshot(run_id, completion_snapshot)
 
         outputs = {
             "instagram": {
@@ -151,16 +192,17 @@ class PipelineRunner:
         self,
         *,
         stage: PipelineStage,
-        snapshots: list[PipelineStageSnapshot],
+        snapshots: list[PipelineStageSnapshot | None],
         executor: Callable[[], Any],
         detail_builder: Callable[[Any], str],
         run_id: str | None = None,
     ) -> Any:
         logger.info("Stage started", extra={"stage": stage.value})
+        slot = PIPELINE_STAGE_INDEX[stage]
         if run_id:
-            await self.state_manager.update_stage(run_id, stage, "running")
+            self.state_manager.update_stage(run_id, stage, "running")
         try:
-            result = await asyncio.to_thread(executor)
+            result = await run_blocking(executor)
             detail = detail_builder(result)
             snapshot = PipelineStageSnapshot(
                 stage=stage,
@@ -168,9 +210,9 @@ class PipelineRunner:
                 detail=detail,
                 payload=self._sanitize_payload(result),
             )
-            snapshots.append(snapshot)
+            snapshots[slot] = snapshot
             if run_id:
-                await self.state_manager.update_stage(run_id, stage, "done", detail, snapshot.payload)
+                self.state_manager.publish_snapshot(run_id, snapshot)
             logger.info("Stage finished", extra={"stage": stage.value})
             return result
         except Exception as exc:
@@ -181,39 +223,58 @@ class PipelineRunner:
                 detail=str(exc),
                 payload=None,
             )
-            snapshots.append(snapshot)
+            snapshots[slot] = snapshot
             if run_id:
-                await self.state_manager.update_stage(run_id, stage, "error", str(exc))
+                self.state_manager.publish_snapshot(run_id, snapshot)
             raise RuntimeError(f"Stage {stage.value} failed") from exc
+        except asyncio.CancelledError:
+            # The worker thread cannot be interrupted, but the stage must not be left "running".
+            logger.warning("Stage cancelled", extra={"stage": stage.value})
+            snapshot = PipelineStageSnapshot(
+                stage=stage,
+                status="error",
+                detail="Cancelled after another stage failed.",
+                payload=None,
+            )
+            snapshots[slot] = snapshot
+            if run_id:
+                self.state_manager.publish_snapshot(run_id, snapshot)
+            raise
 
     def _sanitize_payload(self, payload: Any) -> Any:
         if is_dataclass(payload):
-            return self._sanitize_payload(asdict(payload))
+            payload = asdict(payload)
         if isinstance(payload, dict):
-            sanitized: dict[str, Any] = {}
-            for key, value in payload.items():
-                if key in {"assets"}:
-                    sanitized[key] = [
-                        {
-                            "id": item.get("id"),
-                            "local_path": item.get("local_path"),
-                            "license": item.get("license"),
-                        }
-                        for item in value
-                        if isinstance(item, dict)
-                    ]
-                elif isinstance(value, (str, int, float)):
-                    if isinstance(value, str):
-                        sanitized[key] = self._rewrite_asset_path(value)
-                    else:
-                        sanitized[key] = value
-                else:
-                    sanitized[key] = str(value)
-            return sanitized
+            return {key: self._sanitize_entry(key, value) for key, value in payload.items()}
         if isinstance(payload, (list, tuple)):
             return [self._sanitize_payload(item) for item in payload]
         return payload
 
+    def _sanitize_entry(self, key: str, value: Any) -> Any:
+        """Flatten one payload entry: asset lists are summarised, scalars kept, anything else stringified."""
+
+        if key == "assets":
+            return [
+                {
+                    "id": item.get("id"),
+                    "local_path": item.get("local_path"),
+                    "license": item.get("license"),
+                }
+                for item in value
+                if isinstance(item, dict)
+            ]
+        value_type = type(value)
+        if value_type is str:
+            return self._rewrite_asset_path(value)
+        if value_type in _PASSTHROUGH_TYPES:
+            return value
+        # Subclasses such as StrEnum members miss the exact-type checks above.
+        if isinstance(value, str):
+            return self._rewrite_asset_path(value)
+        if isinstance(value, (int, float)):
+            return value
+        return str(value)
+
     def _format_ingest_detail(self, payload: Any) -> str:
         assets = payload.get("assets", []) if isinstance(payload, dict) else []
         count = len(assets)
@@ -223,14 +284,12 @@ class PipelineRunner:
         return f"Prepared {count} curated clips."
 
     def _public_asset_path(self, path: str | None) -> str | None:
-        if not path:
-            return None
-        try:
-            path_obj = Path(path)
-            relative = path_obj.relative_to(self.settings.outputs_dir)
-        except ValueError:
+        if not path or not path.startswith(self._outputs_prefix):
             return None
-        return f"outputs/{relative.as_posix()}"
+        relative = path[len(self._outputs_prefix):]
+        if os.sep != "/":
+            relative = relative.replace(os.sep, "/")
+        return f"outputs/{relative}"
 
     def _rewrite_asset_path(self, value: str) -> str:
         public_path = self._public_asset_path(value)
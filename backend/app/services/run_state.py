@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import logging
 import uuid
 from dataclasses import dataclass, field
 from typing import Any, Iterable
 
+import orjson
+
+from ..core.config import get_settings
+from ..utils.concurrency import run_blocking
 from ..schemas.pipeline import (
     PipelineRunRequest,
     PipelineRunResponse,
@@ -17,6 +21,8 @@ from ..schemas.pipeline import (
     PipelineStageSnapshot,
 )
 
+logger = logging.getLogger(__name__)
+
 
 PIPELINE_STAGE_ORDER: tuple[PipelineStage, ...] = (
     PipelineStage.ingest,
@@ -27,6 +33,49 @@ PIPELINE_STAGE_ORDER: tuple[PipelineStage, ...] = (
     PipelineStage.analytics,
     PipelineStage.completed,
 )
+# Position of each stage in PIPELINE_STAGE_ORDER; per-run stage lists are indexed by it.
+PIPELINE_STAGE_INDEX: dict[PipelineStage, int] = {stage: index for index, stage in enumerate(PIPELINE_STAGE_ORDER)}
+
+
+def _new_event_queue() -> asyncio.Queue[bytes]:
+    return asyncio.Queue(maxsize=get_settings().sse_queue_max)
+
+
+def _snapshot_dict(snapshot: PipelineStageSnapshot) -> dict[str, Any]:
+    """Event form of a snapshot, built from its known fields instead of via model_dump()."""
+
+    return {
+        "stage": snapshot.stage.value,
+        "status": snapshot.status,
+        "detail": snapshot.detail,
+        "payload": snapshot.payload,
+    }
+
+
+# Every run starts from the same queued snapshots; snapshots are frozen, so share them.
+_QUEUED_SNAPSHOTS: tuple[PipelineStageSnapshot, ...] = tuple(
+    PipelineStageSnapshot(stage=stage, status="queued", detail="Awaiting execution", payload=None)
+    for stage in PIPELINE_STAGE_ORDER
+)
+_QUEUED_DUMPS: tuple[dict[str, Any], ...] = tuple(_snapshot_dict(snapshot) for snapshot in _QUEUED_SNAPSHOTS)
+_SNAPSHOT_CACHE: dict[tuple[PipelineStage, str], PipelineStageSnapshot] = {}
+
+
+def _stage_snapshot(
+    stage: PipelineStage,
+    status: str,
+    detail: str | None = None,
+    payload: Any | None = None,
+) -> PipelineStageSnapshot:
+    """Build a snapshot, reusing one instance per (stage, status) for bare status changes."""
+
+    if detail is not None or payload is not None:
+        return PipelineStageSnapshot(stage=stage, status=status, detail=detail, payload=payload)
+    snapshot = _SNAPSHOT_CACHE.get((stage, status))
+    if snapshot is None:
+        snapshot = PipelineStageSnapshot.model_construct(stage=stage, status=status, detail=None, payload=None)
+        _SNAPSHOT_CACHE[(stage, status)] = snapshot
+    return snapshot
 
 
 @dataclass
@@ -37,60 +86,56 @@ class RunState:
     run_name: str
     request: PipelineRunRequest
     status: PipelineRunStatus = PipelineRunStatus.queued
-    stages: dict[PipelineStage, PipelineStageSnapshot] = field(default_factory=dict)
+    # One snapshot per stage, indexed by PIPELINE_STAGE_INDEX.
+    stages: list[PipelineStageSnapshot] = field(default_factory=lambda: list(_QUEUED_SNAPSHOTS))
+    # Event dict of each entry in `stages`, computed once when the snapshot is published.
+    stage_dumps: list[dict[str, Any]] = field(default_factory=lambda: list(_QUEUED_DUMPS))
     outputs: dict[str, Any] = field(default_factory=dict)
-    queue: asyncio.Queue[str | None] = field(default_factory=asyncio.Queue)
+    queue: asyncio.Queue[bytes] = field(default_factory=_new_event_queue)
+    # Set once no further messages will be published for the run.
+    terminated: asyncio.Event = field(default_factory=asyncio.Event)
 
     def stage_snapshots(self) -> list[PipelineStageSnapshot]:
-        ordered = []
-        for stage in PIPELINE_STAGE_ORDER:
-            snapshot = self.stages.get(stage)
-            if snapshot is not None:
-                ordered.append(snapshot)
-        return ordered
+        return list(self.stages)
 
 
 class RunStateManager:
     """Singleton manager coordinating run state and event emission."""
 
-    _instance: RunStateManager | None = None
-
     def __init__(self) -> None:
+        # Only touched from the event loop thread, so plain dict operations need no lock.
         self._runs: dict[str, RunState] = {}
-        self._lock = asyncio.Lock()
 
     @classmethod
     def instance(cls) -> RunStateManager:
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        return _MANAGER
 
     async def create_run(self, run_name: str, request: PipelineRunRequest) -> RunState:
         run_id = uuid.uuid4().hex
-        queue: asyncio.Queue[str | None] = asyncio.Queue()
-        stages = {
-            stage: PipelineStageSnapshot(stage=stage, status="queued", detail="Awaiting execution", payload=None)
-            for stage in PIPELINE_STAGE_ORDER
-        }
-        state = RunState(run_id=run_id, run_name=run_name, request=request, stages=stages, queue=queue)
-        async with self._lock:
-            self._runs[run_id] = state
-        await queue.put(self._serialize_event({
+        queue = _new_event_queue()
+        state = RunState(
+            run_id=run_id,
+            run_name=run_name,
+            request=request,
+            queue=queue,
+        )
+        self._runs[run_id] = state
+        self._publish(state, self._serialize_event({
             "event": "init",
             "run_id": run_id,
             "run_name": run_name,
-            "stages": [snapshot.model_dump() for snapshot in state.stage_snapshots()],
+            "stages": _QUEUED_DUMPS,
         }))
         return state
 
-    async def mark_run_started(self, run_id: str) -> None:
-        state = await self._get_run(run_id)
+    def mark_run_started(self, run_id: str) -> None:
+        state = self.get_run(run_id)
         if state is None:
             return
         state.status = PipelineRunStatus.running
-        await state.queue.put(self._serialize_event({"event": "run", "run_id": run_id, "status": state.status.value}))
+        self._publish(state, self._serialize_event({"event": "run", "run_id": run_id, "status": state.status.value}))
 
-    async def update_stage(
+    def update_stage(
         self,
         run_id: str,
         stage: PipelineStage,
@@ -98,61 +143,81 @@ class RunStateManager:
         detail: str | None = None,
         payload: Any | None = None,
     ) -> None:
-        state = await self._get_run(run_id)
+        self.publish_snapshot(run_id, _stage_snapshot(stage, status, detail, payload))
+
+    def publish_snapshot(self, run_id: str, snapshot: PipelineStageSnapshot) -> None:
+        """Record a snapshot built by the caller and broadcast it, dumping it only once."""
+
+        state = self.get_run(run_id)
         if state is None:
             return
-        snapshot = PipelineStageSnapshot(stage=stage, status=status, detail=detail, payload=payload)
-        state.stages[stage] = snapshot
-        await state.queue.put(
+        dumped = _snapshot_dict(snapshot)
+        index = PIPELINE_STAGE_INDEX[snapshot.stage]
+        state.stages[index] = snapshot
+        state.stage_dumps[index] = dumped
+        self._publish(
+            state,
             self._serialize_event(
                 {
                     "event": "stage",
                     "run_id": run_id,
-                    "snapshot": snapshot.model_dump(),
+                    "snapshot": dumped,
                 }
-            )
+            ),
         )
 
     async def mark_run_completed(self, run_id: str, response: PipelineRunResponse) -> None:
-        state = await self._get_run(run_id)
+        state = self.get_run(run_id)
         if state is None:
             return
         state.status = PipelineRunStatus.completed
         state.outputs = response.outputs
-        await state.queue.put(self._serialize_event({"event": "run", "run_id": run_id, "status": state.status.value}))
-        await state.queue.put(
-            self._serialize_event(
+        status_frame = self._serialize_event({"event": "run", "run_id": run_id, "status": state.status.value})
+        # The full response is the largest payload of the run; dump and encode it off the event loop.
+        complete_frame = await run_blocking(
+            lambda: self._serialize_event(
                 {
                     "event": "complete",
                     "run_id": run_id,
-                    "response": response.model_dump(),
+                    "response": self._dump_response(state, response),
                 }
             )
         )
-        await state.queue.put(None)
+        # Both frames are final and always consumed together, so queue them as a single message.
+        self._publish(state, status_frame + complete_frame)
+        state.terminated.set()
 
-    async def mark_run_failed(self, run_id: str, message: str) -> None:
-        state = await self._get_run(run_id)
+    def mark_run_failed(self, run_id: str, message: str) -> None:
+        state = self.get_run(run_id)
         if state is None:
             return
         state.status = PipelineRunStatus.error
-        await state.queue.put(self._serialize_event({"event": "run", "run_id": run_id, "status": state.status.value}))
-        await state.queue.put(
-            self._serialize_event(
+        self._publish(
+            state,
+            self._serialize_event({"event": "run", "run_id": run_id, "status": state.status.value})
+            + self._serialize_event(
                 {
                     "event": "error",
                     "run_id": run_id,
                     "message": message,
                 }
-            )
+            ),
         )
-        await state.queue.put(None)
+        state.terminated.set()
+
+    def close_run(self, run_id: str) -> None:
+        """Signal stream consumers that the run will publish nothing further."""
+
+        state = self._runs.get(run_id)
+        if state is not None:
+            state.terminated.set()
 
     async def get_status(self, run_id: str) -> PipelineRunStatusResponse | None:
-        state = await self._get_run(run_id)
+        state = self.get_run(run_id)
         if state is None:
             return None
-        return PipelineRunStatusResponse(
+        # Every field comes from server-side state that was validated on the way in.
+        return PipelineRunStatusResponse.model_construct(
             run_id=run_id,
             run_name=state.run_name,
             status=state.status,
@@ -160,12 +225,39 @@ class RunStateManager:
             outputs=state.outputs,
         )
 
-    def get_queue(self, run_id: str) -> asyncio.Queue[str | None] | None:
-        return self._runs.get(run_id).queue if run_id in self._runs else None
+    def get_run(self, run_id: str) -> RunState | None:
+        return self._runs.get(run_id)
+
+    def _dump_response(self, state: RunState, response: PipelineRunResponse) -> dict[str, Any]:
+        """Dump the final response, reusing stage dicts already produced for stage events."""
+
+        stages = []
+        for snapshot in response.stages:
+            index = PIPELINE_STAGE_INDEX[snapshot.stage]
+            if state.stages[index] is snapshot:
+                stages.append(state.stage_dumps[index])
+            else:
+                stages.append(_snapshot_dict(snapshot))
+        return {**response.model_dump(exclude={"stages"}), "stages": stages}
+
+    def _publish(self, state: RunState, message: bytes) -> None:
+        """Enqueue without blocking the pipeline, evicting the oldest message when full.
+
+        Producers never await here: a stalled or vanished SSE client must not hold up
+        the run, so the bound is enforced by dropping instead of by backpressure.
+        """
+
+        try:
+            state.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            state.queue.get_nowait()
+            state.queue.put_nowait(message)
+            logger.warning("SSE queue full; dropped oldest event", extra={"run_id": state.run_id})
+
+    def _serialize_event(self, payload: dict[str, Any]) -> bytes:
+        # Frames are queued as UTF-8 bytes so the stream writes them without re-encoding.
+        return b"data: " + orjson.dumps(payload) + b"\n\n"
 
-    async def _get_run(self, run_id: str) -> RunState | None:
-        async with self._lock:
-            return self._runs.get(run_id)
 
-    def _serialize_event(self, payload: dict[str, Any]) -> str:
-        return f"data: {json.dumps(payload)}\n\n"
\ No newline at end of file
+# Created at import so every caller shares one manager without a lazy-init race.
+_MANAGER = RunStateManager()
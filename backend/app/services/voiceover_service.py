@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+import os
+import shutil
 import uuid
 from pathlib import Path
 from typing import Any
@@ -17,6 +19,24 @@ except Exception:  # pragma: no cover
 
 logger = logging.getLogger(__name__)
 
+# Reusable assembly buffers for streamed audio. Buffers keep their capacity between
+# runs; oversized ones are dropped rather than pinned for the life of the process.
+_BUFFER_POOL: list[bytearray] = []
+_MAX_POOLED_BUFFERS = 4
+_MAX_POOLED_BUFFER_BYTES = 8 << 20
+
+
+def _acquire_buffer() -> bytearray:
+    try:
+        return _BUFFER_POOL.pop()
+    except IndexError:
+        return bytearray()
+
+
+def _release_buffer(buffer: bytearray) -> None:
+    if len(buffer) <= _MAX_POOLED_BUFFER_BYTES and len(_BUFFER_POOL) < _MAX_POOLED_BUFFERS:
+        _BUFFER_POOL.append(buffer)
+
 
 class VoiceoverService:
     """Streams synthesized audio into the outputs directory."""
@@ -28,6 +48,10 @@ class VoiceoverService:
         self.voice_id = self.settings.tts_voice_id
         self.model_id = self.settings.tts_model
         self.client: Any | None = None
+        # Voice parameters are fixed for the process, so build the request object once.
+        self.voice_settings = self._voice_settings()
+        # Cleared once O_TMPFILE or linking through /proc proves unusable for the audio directory.
+        self._link_tmpfile = True
         self.fallback_voiceover = Path(self.settings.outputs_dir) / "audio" / "demo-1762681313183_voiceover.mp3"
 
         api_key = self.settings.tts_api_key
@@ -48,8 +72,6 @@ class VoiceoverService:
             fallback = self._fallback_audio(output_path)
             return fallback
 
-        temp_path = self.output_dir / f"{uuid.uuid4().hex}.mp3"
-
         try:
             logger.info("Generating voiceover audio", extra={"run": run_name, "provider": "elevenlabs"})
             stream = self.client.text_to_speech.convert(
@@ -58,17 +80,25 @@ class VoiceoverService:
                 model_id=self.model_id,
                 output_format="mp3_44100_128",
                 optimize_streaming_latency="0",
-                voice_settings=self._voice_settings(),
+                voice_settings=self.voice_settings,
             )
 
-            with open(temp_path, "wb") as handle:
+            buffer = _acquire_buffer()
+            try:
+                # Fill the pooled buffer in place; `length` marks the valid prefix.
+                length = 0
                 for chunk in stream:
-                    if isinstance(chunk, bytes):
-                        handle.write(chunk)
-                    elif chunk:
-                        handle.write(str(chunk).encode("utf-8"))
+                    if not isinstance(chunk, bytes):
+                        if not chunk:
+                            continue
+                        chunk = str(chunk).encode("utf-8")
+                    end = length + len(chunk)
+                    buffer[length:end] = chunk
+                    length = end
+                self._write_output(output_path, memoryview(buffer)[:length])
+            finally:
+                _release_buffer(buffer)
 
-            temp_path.replace(output_path)
             return {
                 "voiceover_path": str(output_path),
                 "status": "generated",
@@ -78,10 +108,66 @@ class VoiceoverService:
             }
         except Exception as exc:  # pragma: no cover
             logger.warning("Voiceover synthesis failed: %s", exc)
-            temp_path.unlink(missing_ok=True)
             fallback = self._fallback_audio(output_path, error=str(exc))
             return fallback
 
+    def _write_output(self, output_path: Path, data: memoryview) -> None:
+        """Atomically place `data` at `output_path`; readers never see a partial file."""
+
+        fd = self._open_anonymous_file()
+        if fd is not None:
+            try:
+                with open(fd, "wb", closefd=False) as handle:
+                    handle.write(data)
+                if self._link_into_place(fd, output_path):
+                    return
+            finally:
+                os.close(fd)
+        temp_path = self.output_dir / f"{uuid.uuid4().hex}.mp3"
+        try:
+            with open(temp_path, "wb") as handle:
+                handle.write(data)
+            temp_path.replace(output_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    def _open_anonymous_file(self) -> int | None:
+        """Open an unnamed O_TMPFILE inode in the audio directory, or None where unsupported."""
+
+        tmpfile_flag = getattr(os, "O_TMPFILE", None)
+        if tmpfile_flag is None or not self._link_tmpfile:
+            return None
+        try:
+            return os.open(self.output_dir, tmpfile_flag | os.O_WRONLY, 0o644)
+        except OSError:
+            self._link_tmpfile = False
+            return None
+
+    def _link_into_place(self, fd: int, output_path: Path) -> bool:
+        """Give the anonymous inode behind `fd` the output name; False if linking is unavailable."""
+
+        proc_path = f"/proc/self/fd/{fd}"
+        try:
+            os.link(proc_path, output_path, follow_symlinks=True)
+            return True
+        except FileExistsError:
+            pass
+        except OSError as exc:
+            # Linking through /proc fails the same way every time (e.g. EXDEV under some sandboxes).
+            logger.info("Cannot link anonymous files into %s (%s); writing via rename", self.output_dir, exc)
+            self._link_tmpfile = False
+            return False
+        # linkat never replaces a name, so re-runs link under a scratch name and rename over the output.
+        temp_path = self.output_dir / f"{uuid.uuid4().hex}.mp3"
+        os.link(proc_path, temp_path, follow_symlinks=True)
+        try:
+            temp_path.replace(output_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        return True
+
     def _voice_settings(self):
         if VoiceSettings is None:
             return None
@@ -99,7 +185,7 @@ class VoiceoverService:
         if self.fallback_voiceover.is_file():
             try:
                 output_path.parent.mkdir(parents=True, exist_ok=True)
-                output_path.write_bytes(self.fallback_voiceover.read_bytes())
+                self._link_fallback(output_path)
                 logger.info("Applied fallback voiceover", extra={"source": str(self.fallback_voiceover), "target": str(output_path)})
                 return {
                     "voiceover_path": str(output_path),
@@ -116,3 +202,18 @@ class VoiceoverService:
             "error": error or "tts_unavailable",
             "fallback_available": False,
         }
+
+    def _link_fallback(self, output_path: Path) -> None:
+        """Point `output_path` at the fallback track without copying it through Python."""
+
+        if output_path.exists():
+            if output_path.samefile(self.fallback_voiceover):
+                return
+            output_path.unlink()
+        # Outputs are only ever replaced by rename, never rewritten in place, so sharing an inode is safe.
+        try:
+            os.link(self.fallback_voiceover, output_path)
+        except FileExistsError:
+            pass
+        except OSError:
+            shutil.copyfile(self.fallback_voiceover, output_path)
@@ -0,0 +1,46 @@
+"""Shared worker pool for blocking pipeline work."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, TypeVar
+
+from ..core.config import get_settings
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=1)
+def get_executor() -> ThreadPoolExecutor:
+    """Return the process-wide pool, created on first use and reused by every run."""
+
+    return ThreadPoolExecutor(max_workers=get_settings().pipeline_workers, thread_name_prefix="pipeline")
+
+
+async def run_blocking(func: Callable[[], T]) -> T:
+    """Run `func` on the shared pool, carrying context variables only when any are set."""
+
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func) if len(context) else func
+    return await loop.run_in_executor(get_executor(), call)
+
+
+def in_current_context(func: Callable[..., T]) -> Callable[..., T]:
+    """Wrap `func` so calls made on other threads see the caller's context variables.
+
+    Plain `pool.map`/`pool.submit` run in the worker's own context; use this for
+    nested pools so values such as the current run id follow the work.
+    """
+
+    context = contextvars.copy_context()
+
+    def call(*args: Any, **kwargs: Any) -> T:
+        # A context can only be entered by one thread at a time, so give each call its own copy.
+        return context.copy().run(func, *args, **kwargs)
+
+    return call
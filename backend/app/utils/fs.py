@@ -0,0 +1,18 @@
+"""Filesystem helpers shared by the pipeline services."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+# Directories already created by this process; the app never removes them while running.
+_ENSURED_DIRS: set[str] = set()
+
+
+def ensure_dir(path: Path) -> Path:
+    """Create `path` (and parents) once per process and return it."""
+
+    key = str(path)
+    if key not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(key)
+    return path